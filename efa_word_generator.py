@@ -3,89 +3,188 @@
 EFA Proposal Generator - Creates proper Word documents with formatting
 Requires: python-docx library
 Install: pip install python-docx
+Usage: python -m efa_word_generator                           (interactive)
+       python -m efa_word_generator --batch proposals.json    (one proposal per JSON object)
+       python -m efa_word_generator --stdin-json < proposal.json  (one proposal, no prompts)
+
+JSON proposal objects are described by _JSON_HELP below, also shown by --help.
 """
 
-from pydoc import doc
-from docx import Document
-from docx.shared import Pt, Inches, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+try:
+    from docx import Document
+    from docx.shared import Inches, Pt, RGBColor
+    from docx.enum.style import WD_STYLE_TYPE
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.oxml.ns import nsdecls, nsmap
+    from docx.oxml import parse_xml
+    from docx.oxml.xmlchemy import BaseOxmlElement
+    from lxml import etree
+except ImportError:
+    _DOCX_OK = False
+else:
+    _DOCX_OK = True
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from xml.sax.saxutils import escape
+import argparse
+import copy
 import datetime
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+import io
+import json
 import os
+import re
+import sys
+from zipfile import ZipFile, ZIP_DEFLATED
 
-def add_border_to_paragraph(paragraph, **kwargs):
-    """Add border to paragraph"""
-    p = paragraph._p
-    pPr = p.get_or_add_pPr()
-    pBdr = OxmlElement('w:pBdr')
-    
-    for border_name in ['top', 'left', 'bottom', 'right']:
-        border = OxmlElement(f'w:{border_name}')
-        border.set(qn('w:val'), 'single')
-        border.set(qn('w:sz'), '4')
-        border.set(qn('w:space'), '1')
-        border.set(qn('w:color'), 'auto')
-        pBdr.append(border)
-    
-    pPr.append(pBdr)
+_JSON_HELP = """\
+JSON proposal objects (--batch takes a list of them) need these keys:
+  name, department, company, proposal_title    single-line text
+  date, start_date, end_date                   YYYY-MM-DD dates
+  final_price                                  non-negative number or numeric string, e.g. "100.50"
+  general_info, detailed_info, scope,
+  deliverables, resources                      text, may span lines
+  duration                                     e.g. "4 weeks"
+  pricing_text, contract_text                  the full sentences to print, not menu choices
+All values except final_price must be JSON strings. price_words is optional
+and derived from final_price when left out.
+"""
+
+# Shared lengths, built once instead of on every run
+if _DOCX_OK:
+    _A4_H = Inches(11.69)  # A4
+    _A4_W = Inches(8.27)
+    _M_TB = Inches(0.5)
+    _M_LR = Inches(0.75)
+    _COL0 = Inches(1.5)
+    _COL1 = Inches(4.0)
+    _SZ11 = Pt(11)
+
+# python-docx looks up child elements (rPr, pPr, sz, ...) with find() on
+# almost every property access; precompiled XPath queries are cheaper.
+USE_XPATH_PATCH = True
+
+_CHILD_XPATHS = {}
+
+def _first_child_found_in(self, *tagnames):
+    """First child with tag in `tagnames`, or None if not found"""
+    for tagname in tagnames:
+        xpath = _CHILD_XPATHS.get(tagname)
+        if xpath is None:
+            xpath = _CHILD_XPATHS[tagname] = etree.XPath(f'{tagname}[1]', namespaces=nsmap)
+        found = xpath(self)
+        if found:
+            return found[0]
+    return None
+
+if USE_XPATH_PATCH and _DOCX_OK:
+    BaseOxmlElement.first_child_found_in = _first_child_found_in
+
+_PBDR_XML = (
+    '<w:pBdr>'
+    '<w:top w:val="single" w:sz="4" w:space="1" w:color="auto"/>'
+    '<w:left w:val="single" w:sz="4" w:space="1" w:color="auto"/>'
+    '<w:bottom w:val="single" w:sz="4" w:space="1" w:color="auto"/>'
+    '<w:right w:val="single" w:sz="4" w:space="1" w:color="auto"/>'
+    '</w:pBdr>'
+)
+
+# Prebuilt run properties, used verbatim instead of setting run.font.*.
+# Body runs reference the character styles below rather than repeating
+# size/bold/italic on every run; _skeleton adds them to styles.xml.
+_RPR_10 = '<w:rPr><w:sz w:val="20"/></w:rPr>'
+_RPR_11 = '<w:rPr><w:rStyle w:val="Body11"/></w:rPr>'
+_RPR_11_BOLD = '<w:rPr><w:rStyle w:val="Body11Bold"/></w:rPr>'
+_RPR_11_ITALIC = '<w:rPr><w:rStyle w:val="Body11Italic"/></w:rPr>'
+
+# (style name, bold, italic)
+_BODY_STYLES = (
+    ('Body11', False, False),
+    ('Body11Bold', True, False),
+    ('Body11Italic', False, True),
+)
 
+def _parse_w(xml):
+    """Parse a w: fragment that has no namespace declaration of its own"""
+    return parse_xml(f'<w:root {nsdecls("w")}>{xml}</w:root>')[0]
+
+# Parsed once; _styled_run inserts a copy into each run that uses it
+_RPR_10_ELEMENT = _parse_w(_RPR_10) if _DOCX_OK else None
+
+_ONES = ['', 'One', 'Two', 'Three', 'Four', 'Five', 'Six', 'Seven', 'Eight', 'Nine']
+_TENS = ['', '', 'Twenty', 'Thirty', 'Forty', 'Fifty', 'Sixty', 'Seventy', 'Eighty', 'Ninety']
+_TEENS = ['Ten', 'Eleven', 'Twelve', 'Thirteen', 'Fourteen', 'Fifteen',
+          'Sixteen', 'Seventeen', 'Eighteen', 'Nineteen']
+_SCALES = [(10**9, 'Billion'), (10**6, 'Million'), (10**3, 'Thousand')]
+
+def _compute(n):
+    """Convert a number below one thousand to words"""
+    if n == 0:
+        return ''
+    elif n < 10:
+        return _ONES[n]
+    elif n < 20:
+        return _TEENS[n - 10]
+    elif n < 100:
+        return _TENS[n // 10] + (' ' + _ONES[n % 10] if n % 10 != 0 else '')
+    else:
+        return _ONES[n // 100] + ' Hundred' + (' and ' + _compute(n % 100) if n % 100 != 0 else '')
+
+_BELOW_1000 = tuple(_compute(n) for n in range(1000))
+
+@lru_cache(maxsize=None)
 def number_to_words(num):
     """Convert number to words"""
+    # Deliberately plain Python: this is pure string building, which Numba
+    # supports poorly (its int-to-str is much slower than CPython's), so
+    # JIT compilation would not help. The _BELOW_1000 lookup is the fast path.
+    if num < 0:
+        raise ValueError(f"cannot convert a negative number to words: {num}")
     if num == 0:
         return "Zero"
     
-    ones = ['', 'One', 'Two', 'Three', 'Four', 'Five', 'Six', 'Seven', 'Eight', 'Nine']
-    tens = ['', '', 'Twenty', 'Thirty', 'Forty', 'Fifty', 'Sixty', 'Seventy', 'Eighty', 'Ninety']
-    teens = ['Ten', 'Eleven', 'Twelve', 'Thirteen', 'Fourteen', 'Fifteen', 
-             'Sixteen', 'Seventeen', 'Eighteen', 'Nineteen']
-    
-    def convert_below_thousand(n):
-        if n == 0:
-            return ''
-        elif n < 10:
-            return ones[n]
-        elif n < 20:
-            return teens[n - 10]
-        elif n < 100:
-            return tens[n // 10] + (' ' + ones[n % 10] if n % 10 != 0 else '')
-        else:
-            return ones[n // 100] + ' Hundred' + (' and ' + convert_below_thousand(n % 100) if n % 100 != 0 else '')
-    
-    if num < 1000:
-        return convert_below_thousand(num)
-    elif num < 1000000:
-        thousands = num // 1000
-        remainder = num % 1000
-        result = convert_below_thousand(thousands) + ' Thousand'
-        if remainder > 0:
-            result += ' ' + convert_below_thousand(remainder)
-        return result
-    else:
-        millions = num // 1000000
-        remainder = num % 1000000
-        result = convert_below_thousand(millions) + ' Million'
-        if remainder > 0:
-            if remainder >= 1000:
-                result += ' ' + convert_below_thousand(remainder // 1000) + ' Thousand'
-                if remainder % 1000 > 0:
-                    result += ' ' + convert_below_thousand(remainder % 1000)
-            else:
-                result += ' ' + convert_below_thousand(remainder)
-        return result
+    parts = []
+    for scale, name in _SCALES:
+        if num >= scale:
+            chunk, num = divmod(num, scale)
+            parts.append(number_to_words(chunk) if chunk >= 1000 else _BELOW_1000[chunk])
+            parts.append(name)
+    if num:
+        parts.append(_BELOW_1000[num])
+    return ' '.join(parts)
+
+_PENNY = Decimal('0.01')
+_MAX_AMOUNT = Decimal(10) ** 12  # exclusive; keeps quantize and number_to_words in range
+
+def parse_amount(value, name='amount', positive=False):
+    """Parse a price or count as a finite, non-negative Decimal below _MAX_AMOUNT
+    
+    Raises ValueError naming `name` otherwise; with positive=True zero is rejected too.
+    """
+    try:
+        amount = Decimal(str(value))
+    except InvalidOperation:
+        raise ValueError(f"{name} is not a number: {value!r}") from None
+    if not amount.is_finite() or amount < 0 or amount >= _MAX_AMOUNT or (positive and amount == 0):
+        limit = "greater than 0" if positive else "at least 0"
+        raise ValueError(f"{name} must be a number {limit} and below {_MAX_AMOUNT:,}: {value!r}")
+    return amount
 
+def _to_pence(amount):
+    """Round an amount to whole pence, half up"""
+    # str() keeps floats like 0.29 from becoming 28 pence
+    return Decimal(str(amount)).quantize(_PENNY, ROUND_HALF_UP)
+
+@lru_cache(maxsize=None)
 def price_to_words(price):
     """Convert price to words"""
-    pounds = int(price)
-    pence = round((price - pounds) * 100)
-    
-    result = number_to_words(pounds) + ' Pounds'
-    
-    if pence > 0:
-        result += ' and ' + number_to_words(pence) + ' Pence'
+    pence_total = int(_to_pence(price) * 100)
+    pounds, pence = divmod(pence_total, 100)
     
-    return result
+    return ' '.join([number_to_words(pounds), 'Pounds'] +
+                    (['and', number_to_words(pence), 'Pence'] if pence else []))
 
+@lru_cache(maxsize=None)
 def get_contract_text(contract_type):
     """Get contract clause text"""
     contracts = {
@@ -102,8 +201,8 @@ def create_header_table(doc):
     table.style = 'Table Grid'
     
     # Set column widths
-    table.columns[0].width = Inches(1.5)
-    table.columns[1].width = Inches(4.0)
+    table.columns[0].width = _COL0
+    table.columns[1].width = _COL1
     
     # Row 1
     table.rows[0].cells[0].text = 'Document Ref. No.'
@@ -119,201 +218,257 @@ def create_header_table(doc):
     
     return table
 
-def create_proposal_document(data):
-    """Create the formatted Word document"""
-    doc = Document()
-    
-    # Set up the page
-    section = doc.sections[0]
-    section.page_height = Inches(11.69)  # A4
-    section.page_width = Inches(8.27)
-    section.top_margin = Inches(0.5)
-    section.bottom_margin = Inches(0.5)
-    section.left_margin = Inches(0.75)
-    section.right_margin = Inches(0.75)
-    
-    # Header section with table and "Private and Confidential"
-    header_table = create_header_table(doc)
-    
-    # Add "Private and Confidential" aligned right
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-    run = p.add_run('Private and Confidential')
-    run.font.size = Pt(10)
-    
-    doc.add_paragraph()  # Spacing
-    doc = Document()
-
-# Add logo to the top of the Word document
-    doc.add_picture('efa_logo.png', width=Inches(1.5))
+def _styled_run(p, text, rpr):
+    """Add a run to paragraph carrying a copy of a prebuilt rPr element"""
+    run = p.add_run(text)
+    run._r.insert(0, copy.deepcopy(rpr))
+    return run
+
+# Characters XML 1.0 does not allow; tab, LF and CR are handled by _xml_text
+_INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]')
+
+def _xml_line(line):
+    """Render one line of text, turning tabs into <w:tab/>"""
+    return '<w:tab/>'.join(f'<w:t xml:space="preserve">{escape(chunk)}</w:t>' if chunk else ''
+                           for chunk in line.split('\t'))
+
+def _xml_text(text):
+    """Render text as run content, turning line breaks into <w:br/> and tabs into <w:tab/>"""
+    bad = _INVALID_XML_CHARS.search(text)
+    if bad:
+        raise ValueError(f"text contains a character not allowed in a Word document: {bad.group()!r}")
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return '<w:br/>'.join(_xml_line(line) for line in text.split('\n'))
+
+# Signature block, one paragraph per entry; None is an empty spacing paragraph
+FIXED_RUNS = (
+    ('Yours sincerely', _RPR_11),
+    None,
+    ('Alex Edwards', _RPR_11_BOLD),
+    ('Managing Director', _RPR_11_BOLD),
+    ('+44 (0)7734 646510', _RPR_11),
+    None,
+    ('EFA Engineering Limited', _RPR_11_BOLD),
+    ('128 City Road,\nLondon,\nUnited Kingdom,\nEC1V 2NX', _RPR_11),
+)
+
+_SIGNATURE_XML = ''.join('<w:p/>' if entry is None else f'<w:p><w:r>{entry[1]}{_xml_text(entry[0])}</w:r></w:p>'
+                         for entry in FIXED_RUNS)
+
+# Proposal body below the logo, spliced into the skeleton's word/document.xml;
+# {fields} are filled with _xml_text output
+_BODY_XML = (
     # FAO section
-    p = doc.add_paragraph()
-    
-    run = p.add_run(f'FAO: {data["name"]}\n')
-    run.font.size = Pt(11)
-    run = p.add_run(f'{data["department"]}\n')
-    run.font.size = Pt(11)
-    run = p.add_run(f'{data["company"]}\n\n')
-    run.font.size = Pt(11)
-    run = p.add_run(f'{data["date"]}')
-    run.font.size = Pt(11)
-    
-    doc.add_paragraph()  # Spacing
-    
+    '<w:p>'
+    '<w:r>' + _RPR_11 + '<w:t xml:space="preserve">FAO: </w:t>{name}<w:br/></w:r>'
+    '<w:r>' + _RPR_11 + '{department}<w:br/></w:r>'
+    '<w:r>' + _RPR_11 + '{company}<w:br/><w:br/></w:r>'
+    '<w:r>' + _RPR_11 + '{date}</w:r>'
+    '</w:p>'
+    '<w:p/>'
     # "Private and Confidential" again
-    p = doc.add_paragraph('Private and Confidential')
-    p.runs[0].font.size = Pt(11)
-    
-    doc.add_paragraph()  # Spacing
-    
+    '<w:p><w:r>' + _RPR_11 + '<w:t>Private and Confidential</w:t></w:r></w:p>'
+    '<w:p/>'
     # Dear line
-    p = doc.add_paragraph(f'Dear {data["name"]},')
-    p.runs[0].font.size = Pt(11)
-    
-    doc.add_paragraph()  # Spacing
-    
+    '<w:p><w:r>' + _RPR_11 + '<w:t xml:space="preserve">Dear </w:t>{name}<w:t>,</w:t></w:r></w:p>'
+    '<w:p/>'
     # Re: line
-    p = doc.add_paragraph()
-    run = p.add_run(f'Re: {data["proposal_title"]}')
-    run.font.size = Pt(11)
-    run.font.bold = True
-    
+    '<w:p><w:r>' + _RPR_11_BOLD + '<w:t xml:space="preserve">Re: </w:t>{proposal_title}</w:r></w:p>'
     # Main content box with border
-    p = doc.add_paragraph()
-    add_border_to_paragraph(p)
-    run = p.add_run(f'{data["general_info"]}\n\n')
-    run.font.size = Pt(11)
-    
-    run = p.add_run(f'Our price for the work is £{data["final_price"]:.2f} ({data["price_words"]}). Excluding VAT.\n\n')
-    run.font.size = Pt(11)
-    
-    run = p.add_run(f'{data["pricing_text"]}\n\n')
-    run.font.size = Pt(11)
-    
-    run = p.add_run('Please see full details of scope and deliverables on the following pages:')
-    run.font.size = Pt(11)
-    
+    f'<w:p><w:pPr>{_PBDR_XML}</w:pPr>'
+    '<w:r>' + _RPR_11 + '{general_info}<w:br/><w:br/></w:r>'
+    '<w:r>' + _RPR_11 + '<w:t xml:space="preserve">Our price for the work is £{final_price} (</w:t>'
+    '{price_words}<w:t>). Excluding VAT.</w:t><w:br/><w:br/></w:r>'
+    '<w:r>' + _RPR_11 + '{pricing_text}<w:br/><w:br/></w:r>'
+    '<w:r>' + _RPR_11 + '<w:t>Please see full details of scope and deliverables on the following pages:</w:t></w:r>'
+    '</w:p>'
     # Detailed Information box
-    p = doc.add_paragraph()
-    add_border_to_paragraph(p)
-    run = p.add_run(f'{data["detailed_info"]}\n\n')
-    run.font.size = Pt(11)
-    
-    run = p.add_run('Scope\n\n')
-    run.font.size = Pt(11)
-    run.font.bold = True
-    
-    run = p.add_run(f'{data["scope"]}\n\n')
-    run.font.size = Pt(11)
-    run.font.bold = False
-    
-    run = p.add_run('Deliverables\n\n')
-    run.font.size = Pt(11)
-    run.font.bold = True
-    
-    run = p.add_run(f'{data["deliverables"]}\n\n')
-    run.font.size = Pt(11)
-    run.font.bold = False
-    
-    run = p.add_run('Resources\n\n')
-    run.font.size = Pt(11)
-    run.font.bold = True
-    
-    run = p.add_run(f'{data["resources"]}')
-    run.font.size = Pt(11)
-    run.font.bold = False
-    
+    f'<w:p><w:pPr>{_PBDR_XML}</w:pPr>'
+    '<w:r>' + _RPR_11 + '{detailed_info}<w:br/><w:br/></w:r>'
+    '<w:r>' + _RPR_11_BOLD + '<w:t>Scope</w:t><w:br/><w:br/></w:r>'
+    '<w:r>' + _RPR_11 + '{scope}<w:br/><w:br/></w:r>'
+    '<w:r>' + _RPR_11_BOLD + '<w:t>Deliverables</w:t><w:br/><w:br/></w:r>'
+    '<w:r>' + _RPR_11 + '{deliverables}<w:br/><w:br/></w:r>'
+    '<w:r>' + _RPR_11_BOLD + '<w:t>Resources</w:t><w:br/><w:br/></w:r>'
+    '<w:r>' + _RPR_11 + '{resources}</w:r>'
+    '</w:p>'
     # DURATION section
-    p = doc.add_paragraph()
-    add_border_to_paragraph(p)
-    run = p.add_run('DURATION\n\n')
-    run.font.size = Pt(11)
-    run.font.bold = True
-    
-    run = p.add_run(f'The duration of the work is {data["duration"]}, commencing on {data["start_date"]} and concluding on {data["end_date"]}. The project will be billed periodically with the payment application being supported by an up-to-date delivery programme.')
-    run.font.size = Pt(11)
-    run.font.bold = False
-    
+    f'<w:p><w:pPr>{_PBDR_XML}</w:pPr>'
+    '<w:r>' + _RPR_11_BOLD + '<w:t>DURATION</w:t><w:br/><w:br/></w:r>'
+    '<w:r>' + _RPR_11 + '<w:t xml:space="preserve">The duration of the work is </w:t>{duration}'
+    '<w:t xml:space="preserve">, commencing on </w:t>{start_date}<w:t xml:space="preserve"> and concluding on </w:t>{end_date}'
+    '<w:t>. The project will be billed periodically with the payment application being supported by an up-to-date delivery programme.</w:t></w:r>'
+    '</w:p>'
     # COMMERCIAL section
-    p = doc.add_paragraph()
-    add_border_to_paragraph(p)
-    run = p.add_run('COMMERCIAL\n\n')
-    run.font.size = Pt(11)
-    run.font.bold = True
-    
-    run = p.add_run(f'{data["contract_text"]}\n\n')
-    run.font.size = Pt(11)
-    run.font.bold = False
-    
-    run = p.add_run('The ')
-    run.font.size = Pt(11)
-    run = p.add_run('law of the contract')
-    run.font.size = Pt(11)
-    run.font.italic = True
-    run = p.add_run(' is the Law of England and Wales.\n')
-    run.font.size = Pt(11)
-    
-    run = p.add_run('The ')
-    run.font.size = Pt(11)
-    run = p.add_run('assessment day')
-    run.font.size = Pt(11)
-    run.font.italic = True
-    run = p.add_run(' is within 28 days from the ')
-    run.font.size = Pt(11)
-    run = p.add_run('starting date')
-    run.font.size = Pt(11)
-    run.font.italic = True
-    run = p.add_run('.\n')
-    run.font.size = Pt(11)
-    
-    run = p.add_run('The rate for ')
-    run.font.size = Pt(11)
-    run = p.add_run('delay damages')
-    run.font.size = Pt(11)
-    run.font.italic = True
-    run = p.add_run(' is £0 per day.\n')
-    run.font.size = Pt(11)
-    
-    run = p.add_run('The ')
-    run.font.size = Pt(11)
-    run = p.add_run('period for reply')
-    run.font.size = Pt(11)
-    run.font.italic = True
-    run = p.add_run(' is 2 weeks.\n\n')
-    run.font.size = Pt(11)
-    
-    run = p.add_run('EFA Engineering holds Professional Indemnity insurance of up to £5 million and Public Liability insurance of up to £5 million. Our liability for any matter is limited to 10% of the contract Price.')
-    run.font.size = Pt(11)
-    
-    doc.add_paragraph()  # Spacing
-    
+    f'<w:p><w:pPr>{_PBDR_XML}</w:pPr>'
+    '<w:r>' + _RPR_11_BOLD + '<w:t>COMMERCIAL</w:t><w:br/><w:br/></w:r>'
+    '<w:r>' + _RPR_11 + '{contract_text}<w:br/><w:br/></w:r>'
+    '<w:r>' + _RPR_11 + '<w:t xml:space="preserve">The </w:t></w:r>'
+    '<w:r>' + _RPR_11_ITALIC + '<w:t>law of the contract</w:t></w:r>'
+    '<w:r>' + _RPR_11 + '<w:t xml:space="preserve"> is the Law of England and Wales.</w:t><w:br/></w:r>'
+    '<w:r>' + _RPR_11 + '<w:t xml:space="preserve">The </w:t></w:r>'
+    '<w:r>' + _RPR_11_ITALIC + '<w:t>assessment day</w:t></w:r>'
+    '<w:r>' + _RPR_11 + '<w:t xml:space="preserve"> is within 28 days from the </w:t></w:r>'
+    '<w:r>' + _RPR_11_ITALIC + '<w:t>starting date</w:t></w:r>'
+    '<w:r>' + _RPR_11 + '<w:t>.</w:t><w:br/></w:r>'
+    '<w:r>' + _RPR_11 + '<w:t xml:space="preserve">The rate for </w:t></w:r>'
+    '<w:r>' + _RPR_11_ITALIC + '<w:t>delay damages</w:t></w:r>'
+    '<w:r>' + _RPR_11 + '<w:t xml:space="preserve"> is £0 per day.</w:t><w:br/></w:r>'
+    '<w:r>' + _RPR_11 + '<w:t xml:space="preserve">The </w:t></w:r>'
+    '<w:r>' + _RPR_11_ITALIC + '<w:t>period for reply</w:t></w:r>'
+    '<w:r>' + _RPR_11 + '<w:t xml:space="preserve"> is 2 weeks.</w:t><w:br/><w:br/></w:r>'
+    '<w:r>' + _RPR_11 + '<w:t>EFA Engineering holds Professional Indemnity insurance of up to £5 million and Public Liability insurance of up to £5 million. Our liability for any matter is limited to 10% of the contract Price.</w:t></w:r>'
+    '</w:p>'
+    '<w:p/>'
     # Signature section
-    p = doc.add_paragraph('Yours sincerely')
-    p.runs[0].font.size = Pt(11)
-    
-    doc.add_paragraph()  # Spacing for signature
-    
-    p = doc.add_paragraph('Alex Edwards')
-    p.runs[0].font.size = Pt(11)
-    p.runs[0].font.bold = True
-    
-    p = doc.add_paragraph('Managing Director')
-    p.runs[0].font.size = Pt(11)
-    p.runs[0].font.bold = True
-    
-    p = doc.add_paragraph('+44 (0)7734 646510')
-    p.runs[0].font.size = Pt(11)
-    
-    doc.add_paragraph()  # Spacing
-    
-    p = doc.add_paragraph('EFA Engineering Limited')
-    p.runs[0].font.size = Pt(11)
-    p.runs[0].font.bold = True
-    
-    p = doc.add_paragraph('128 City Road,\nLondon,\nUnited Kingdom,\nEC1V 2NX')
-    p.runs[0].font.size = Pt(11)
-    
-    return doc
+    + _SIGNATURE_XML
+)
+
+# Text fields of data used by _BODY_XML, apart from the formatted final_price
+_BODY_FIELDS = ('name', 'department', 'company', 'date', 'proposal_title', 'general_info',
+                'price_words', 'pricing_text', 'detailed_info', 'scope', 'deliverables',
+                'resources', 'duration', 'start_date', 'end_date', 'contract_text')
+
+# Keys a JSON proposal object must provide (see the module docstring)
+_JSON_FIELDS = tuple(key for key in _BODY_FIELDS if key != 'price_words') + ('final_price',)
+
+_SKELETON = None
+
+def _skeleton():
+    """Build the page setup, header table and logo once with python-docx
+    
+    Returns the package parts as a {name: bytes} dict plus word/document.xml
+    split into the text before and after the point where the body goes.
+    """
+    global _SKELETON
+    if _SKELETON is None:
+        doc = Document()
+        
+        # Character styles used by the body runs
+        for name, bold, italic in _BODY_STYLES:
+            style = doc.styles.add_style(name, WD_STYLE_TYPE.CHARACTER)
+            style.font.size = _SZ11
+            if bold:
+                style.font.bold = True
+            if italic:
+                style.font.italic = True
+        
+        # Set up the page
+        section = doc.sections[0]
+        section.page_height = _A4_H
+        section.page_width = _A4_W
+        section.top_margin = _M_TB
+        section.bottom_margin = _M_TB
+        section.left_margin = _M_LR
+        section.right_margin = _M_LR
+        
+        # Header section with table and "Private and Confidential"
+        create_header_table(doc)
+        
+        # Add "Private and Confidential" aligned right
+        p = doc.add_paragraph()
+        p.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+        _styled_run(p, 'Private and Confidential', _RPR_10_ELEMENT)
+        
+        doc.add_paragraph()  # Spacing
+        
+        # Add logo to the top of the Word document
+        doc.add_picture('efa_logo.png', width=_COL0)
+        
+        buf = io.BytesIO()
+        doc.save(buf)
+        with ZipFile(buf) as z:
+            parts = {name: z.read(name) for name in z.namelist()}
+        document_xml = parts.pop('word/document.xml').decode('utf-8')
+        split = document_xml.rindex('<w:sectPr')
+        _SKELETON = parts, document_xml[:split], document_xml[split:]
+    return _SKELETON
+
+def create_proposal_document(data):
+    """Create the formatted Word document and return it as .docx bytes"""
+    parts, head, tail = _skeleton()
+    
+    fields = {key: _xml_text(str(data[key])) for key in _BODY_FIELDS}
+    fields['final_price'] = f'{_to_pence(data["final_price"]):.2f}'
+    document_xml = head + _BODY_XML.format_map(fields) + tail
+    
+    buf = io.BytesIO()
+    with ZipFile(buf, 'w', ZIP_DEFLATED, compresslevel=1) as z:
+        z.writestr('[Content_Types].xml', parts['[Content_Types].xml'])
+        z.writestr('word/document.xml', document_xml.encode('utf-8'))
+        for name, blob in parts.items():
+            if name != '[Content_Types].xml':
+                z.writestr(name, blob)
+    return buf.getvalue()
+
+def proposal_path(data, out_dir=''):
+    """Path the proposal for `data` is saved to"""
+    return os.path.join(out_dir, f"Proposal_{data['proposal_title'].replace(' ', '_')}_{data['date']}.docx")
+
+def save_proposal(data, out_dir=''):
+    """Create the proposal document and write it to out_dir, returning the path"""
+    filename = proposal_path(data, out_dir)
+    docx_bytes = create_proposal_document(data)
+    with open(filename, 'wb') as f:
+        f.write(docx_bytes)
+    return filename
+
+def validate_proposal(data):
+    """Check one JSON proposal object and return a normalised copy
+    
+    Raises ValueError naming the offending key. final_price becomes a Decimal,
+    dates are normalised to YYYY-MM-DD and price_words is filled in if missing.
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"proposal data must be a JSON object, got {type(data).__name__}")
+    missing = [key for key in _JSON_FIELDS if key not in data]
+    if missing:
+        raise ValueError(f"proposal data is missing required keys: {', '.join(missing)}")
+    
+    data = dict(data)
+    for key in _BODY_FIELDS:
+        if key in data and not isinstance(data[key], str):
+            raise ValueError(f"{key} must be a string, got {type(data[key]).__name__}")
+    data['final_price'] = parse_amount(data['final_price'], 'final_price')
+    for key in ('date', 'start_date', 'end_date'):
+        try:
+            data[key] = datetime.date.fromisoformat(data[key]).isoformat()
+        except ValueError:
+            raise ValueError(f"{key} must be a YYYY-MM-DD date, got {data[key]!r}") from None
+    if 'price_words' not in data:
+        data['price_words'] = price_to_words(data['final_price'])
+    return data
+
+def _batch_one(data, out_dir):
+    """Validate and save one JSON proposal object"""
+    return save_proposal(validate_proposal(data), out_dir)
+
+def generate_many(inputs, out_dir='', workers=None):
+    """Create one proposal per data dict in parallel worker processes
+    
+    Every input is validated, and checked for a clashing output path, before
+    the pool starts, so a bad entry stops the run without writing any file.
+    """
+    proposals = []
+    seen = {}
+    for i, data in enumerate(inputs):
+        try:
+            proposal = validate_proposal(data)
+        except ValueError as e:
+            raise ValueError(f"proposal {i}: {e}") from None
+        path = os.path.normcase(os.path.abspath(proposal_path(proposal, out_dir)))
+        if path in seen:
+            raise ValueError(f"proposals {seen[path]} and {i} would both be saved as "
+                             f"{proposal_path(proposal, out_dir)}; give them different titles or dates")
+        seen[path] = i
+        proposals.append(proposal)
+    
+    with ProcessPoolExecutor(workers) as ex:
+        return list(ex.map(partial(save_proposal, out_dir=out_dir), proposals))
+
+# Pricing sentences, shared across consultants and batch runs
+_PERIOD_TMPL = "The price covers a {periods}-{unit} period, based upon £{rate:.2f} per {unit}.".format
+_CONSULTANT_TMPL = "{title} for £{rate} per shift and an anticipated combined number of {shifts} total shifts.".format
 
 def get_multiline_input(prompt):
     """Get multiline text input"""
@@ -328,8 +483,42 @@ def get_multiline_input(prompt):
         lines.append(line)
     return "\n".join(lines)
 
-def main():
-    os.system('cls' if os.name == 'nt' else 'clear')
+def get_date_input(prompt, default=None):
+    """Get a YYYY-MM-DD date, asking again until it parses"""
+    while True:
+        text = input(prompt).strip()
+        if not text and default is not None:
+            return default
+        try:
+            return datetime.date.fromisoformat(text)
+        except ValueError:
+            print("  Please enter a valid date as YYYY-MM-DD.")
+
+def get_decimal_input(prompt, name, positive=False):
+    """Get a number as a Decimal, asking again until parse_amount accepts it"""
+    while True:
+        try:
+            return parse_amount(input(prompt).strip(), name, positive)
+        except ValueError as e:
+            print(f"  {e}")
+
+def _clear():
+    """Clear the terminal without spawning a shell"""
+    if not sys.stdout.isatty():
+        return
+    if os.name == 'nt':
+        # Enable ANSI escape handling (ENABLE_VIRTUAL_TERMINAL_PROCESSING) on the console
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)
+        mode = ctypes.c_ulong()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+    sys.stdout.write('\x1b[2J\x1b[H')
+    sys.stdout.flush()
+
+def run_interactive():
+    _clear()
     print("=" * 70)
     print(" " * 15 + "EFA PROPOSAL GENERATOR - WORD FORMAT")
     print("=" * 70)
@@ -344,8 +533,9 @@ def main():
     data['department'] = input("Department/Directorate: ").strip()
     data['company'] = input("Company Name: ").strip()
     
-    date_input = input("Date (YYYY-MM-DD) [Enter for today]: ").strip()
-    data['date'] = date_input if date_input else datetime.date.today().strftime('%Y-%m-%d')
+    proposal_date = get_date_input("Date (YYYY-MM-DD) [Enter for today]: ", datetime.date.today())
+    data['date'] = proposal_date.isoformat()
+    data['proposal_date'] = proposal_date
     
     data['proposal_title'] = input("Proposal Title: ").strip()
     
@@ -359,15 +549,15 @@ def main():
     print("  2. Timesheets")
     proposal_type = input("Select (1 or 2): ").strip()
     
-    data['final_price'] = float(input("Final Price (£): ").strip())
+    data['final_price'] = get_decimal_input("Final Price (£): ", "Final price")
     data['price_words'] = price_to_words(data['final_price'])
     
     pricing_text = ""
     if proposal_type == "1":
-        periods = input("Number of weeks/months: ").strip()
+        periods = get_decimal_input("Number of weeks/months: ", "Number of weeks/months", positive=True)
         unit = input("Unit (week/month): ").strip()
-        rate = data['final_price'] / float(periods)
-        pricing_text = f"The price covers a {periods}-{unit} period, based upon £{rate:.2f} per {unit}."
+        rate = _to_pence(data['final_price'] / periods)
+        pricing_text = _PERIOD_TMPL(periods=periods, unit=unit, rate=rate)
     else:
         print("\nEnter consultant details:")
         consultants = []
@@ -377,7 +567,7 @@ def main():
                 break
             charge_rate = input("  Charge Rate (£): ").strip()
             total_shifts = input("  Total Shifts: ").strip()
-            consultants.append(f"{job_title} for £{charge_rate} per shift and an anticipated combined number of {total_shifts} total shifts.")
+            consultants.append(_CONSULTANT_TMPL(title=job_title, rate=charge_rate, shifts=total_shifts))
         
         pricing_text = "The price is based upon the below charge out rates and shifts:\n\n" + "\n".join(consultants)
     
@@ -395,8 +585,8 @@ def main():
     print("\n📅 DURATION")
     print("-" * 70)
     data['duration'] = input("Duration (e.g., '4 weeks' or '6 months'): ").strip()
-    data['start_date'] = input("Starting Date (YYYY-MM-DD): ").strip()
-    data['end_date'] = input("Ending Date (YYYY-MM-DD): ").strip()
+    data['start_date'] = get_date_input("Starting Date (YYYY-MM-DD): ").isoformat()
+    data['end_date'] = get_date_input("Ending Date (YYYY-MM-DD): ").isoformat()
     
     # Commercial Terms
     print("\n📄 COMMERCIAL TERMS")
@@ -414,16 +604,43 @@ def main():
     print("Generating Word document...")
     print("=" * 70)
     
-    doc = create_proposal_document(data)
-    
-    # Save document
-    filename = f"Proposal_{data['proposal_title'].replace(' ', '_')}_{data['date']}.docx"
-    doc.save(filename)
+    filename = save_proposal(data)
     
     print(f"\n✅ SUCCESS! Word document created: {filename}")
     print(f"📁 Location: {os.path.abspath(filename)}")
     print("\n" + "=" * 70)
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="EFA Proposal Generator - Word format",
+                                     epilog=_JSON_HELP,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--batch', metavar='JSON',
+                      help="JSON file with a list of proposal data objects to generate")
+    mode.add_argument('--stdin-json', action='store_true',
+                      help="Read one proposal data object as JSON from stdin instead of prompting")
+    parser.add_argument('--out-dir', default='', help="Directory for generated files (default: current)")
+    args = parser.parse_args(argv)
+    
+    if not _DOCX_OK:
+        raise ImportError("python-docx is required to generate documents")
+    
+    if args.batch:
+        with open(args.batch, encoding='utf-8') as f:
+            inputs = json.load(f, parse_float=Decimal)
+        if not isinstance(inputs, list):
+            raise ValueError("--batch expects a JSON list of proposal objects")
+        for filename in generate_many(inputs, args.out_dir):
+            print(f"✅ Word document created: {filename}")
+        return
+    
+    if args.stdin_json:
+        filename = _batch_one(json.load(sys.stdin, parse_float=Decimal), args.out_dir)
+        print(f"✅ Word document created: {filename}")
+        return
+    
+    run_interactive()
+
 if __name__ == "__main__":
     try:
         main()